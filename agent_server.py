@@ -28,38 +28,161 @@ Example langgraph.json:
     }
 """
 
+import asyncio
+import functools
 import os
+import sys
+from dataclasses import dataclass, replace
 
 from deepagents.middleware.questions import create_ask_human_tool
 from deepagents_cli.agent import create_cli_agent
 from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.checkpoint.postgres import PostgresSaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.graph.state import CompiledStateGraph
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 
 # ============================================
 # Configuration - Edit these for your setup
 # ============================================
 
+# Snapshot the relevant environment once at import; everything below reads from it
+_ENV = {
+    k: os.environ.get(k)
+    for k in (
+        "ASSISTANT_ID",
+        "MODEL_NAME",
+        "ENABLE_MEMORY",
+        "ENABLE_SKILLS",
+        "ENABLE_SHELL",
+        "ENABLE_QUESTIONS",
+        "AUTO_APPROVE",
+        "POSTGRES_URI",
+    )
+}
+
+
+def _env(name: str, default: str | None = None) -> str | None:
+    """Read a value from the import-time environment snapshot."""
+    value = _ENV[name]
+    return default if value is None else value
+
+
+_TRUE_SET = frozenset({"true", "True", "TRUE", "1", "yes"})
+
+
+def _bool_env(name: str, default: str = "false") -> bool:
+    """Parse a boolean flag from the environment snapshot."""
+    return _env(name, default) in _TRUE_SET
+
+
 # Assistant ID - this is the name shown in deep-agents-ui
-ASSISTANT_ID = os.getenv("ASSISTANT_ID", "deep-agent")
+ASSISTANT_ID = _env("ASSISTANT_ID", "deep-agent")
 
 # Model configuration (format: "provider:model_name")
 # Examples: "google_genai:gemini-3-flash-preview", "anthropic:claude-sonnet-4-5-20250929", "openai:gpt-4o"
-MODEL_NAME = os.getenv("MODEL_NAME", "google_genai:gemini-3-flash-preview")
+MODEL_NAME = _env("MODEL_NAME", "google_genai:gemini-3-flash-preview")
 
 # Enable/disable features
-ENABLE_MEMORY = os.getenv("ENABLE_MEMORY", "true").lower() == "true"
-ENABLE_SKILLS = os.getenv("ENABLE_SKILLS", "true").lower() == "true"
-ENABLE_SHELL = os.getenv("ENABLE_SHELL", "true").lower() == "true"
-ENABLE_QUESTIONS = os.getenv("ENABLE_QUESTIONS", "true").lower() == "true"
+ENABLE_MEMORY = _bool_env("ENABLE_MEMORY", "true")
+ENABLE_SKILLS = _bool_env("ENABLE_SKILLS", "true")
+ENABLE_SHELL = _bool_env("ENABLE_SHELL", "true")
+ENABLE_QUESTIONS = _bool_env("ENABLE_QUESTIONS", "true")
 
 # Auto-approve mode (bypass HITL for all tools)
-AUTO_APPROVE = os.getenv("AUTO_APPROVE", "false").lower() == "true"
+AUTO_APPROVE = _bool_env("AUTO_APPROVE")
 
 # Postgres connection for production persistence (optional)
-POSTGRES_URI = os.getenv("POSTGRES_URI", None)
+POSTGRES_URI = _env("POSTGRES_URI")
+
+
+@dataclass(frozen=True)
+class _Config:
+    """Resolved server configuration, shared by every factory invocation."""
+
+    assistant_id: str
+    model_name: str
+    enable_memory: bool
+    enable_skills: bool
+    enable_shell: bool
+    enable_questions: bool
+    auto_approve: bool
+    postgres_uri: str | None
+
+
+_CONFIG = _Config(
+    assistant_id=ASSISTANT_ID,
+    model_name=MODEL_NAME,
+    enable_memory=ENABLE_MEMORY,
+    enable_skills=ENABLE_SKILLS,
+    enable_shell=ENABLE_SHELL,
+    enable_questions=ENABLE_QUESTIONS,
+    auto_approve=AUTO_APPROVE,
+    postgres_uri=POSTGRES_URI,
+)
+
+
+def _resolve_config(
+    assistant_id: str | None,
+    model: str | None,
+    auto_approve: bool | None,
+    enable_questions: bool | None,
+) -> _Config:
+    """Apply per-call overrides on top of the environment configuration."""
+    # The common case passes no overrides; share the module config as-is
+    if assistant_id is None and model is None and auto_approve is None and enable_questions is None:
+        return _CONFIG
+    return replace(
+        _CONFIG,
+        assistant_id=assistant_id or _CONFIG.assistant_id,
+        model_name=model or _CONFIG.model_name,
+        auto_approve=auto_approve if auto_approve is not None else _CONFIG.auto_approve,
+        enable_questions=enable_questions if enable_questions is not None else _CONFIG.enable_questions,
+    )
+
+
+def _build_server_agent(
+    config: _Config,
+    model_obj: BaseChatModel,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
+    """Assemble the agent once the model (and optional checkpointer) exist."""
+    # Build list of additional tools
+    extra_tools = []
+    status_lines = []
+    if config.enable_questions:
+        ask_human_tool = create_ask_human_tool()
+        extra_tools.append(ask_human_tool)
+        status_lines.append("✅ ask_human tool enabled")
+    
+    # Create the base agent using create_cli_agent
+    # Note: use_persistence=False because LangGraph API handles persistence automatically
+    agent, backend = create_cli_agent(
+        model=model_obj,
+        assistant_id=config.assistant_id,
+        tools=extra_tools,  # Pass ask_human tool
+        auto_approve=config.auto_approve,
+        enable_memory=config.enable_memory,
+        enable_skills=config.enable_skills,
+        enable_shell=config.enable_shell,
+        checkpointer=checkpointer,
+        use_persistence=False,  # LangGraph API handles persistence
+    )
+    
+    status_lines += [
+        "✅ Agent server created",
+        f"   Assistant ID: {config.assistant_id}",
+        f"   Model: {config.model_name}",
+        f"   Questions enabled: {config.enable_questions}",
+    ]
+    # One write for the whole status block
+    sys.stdout.write("\n".join(status_lines) + "\n")
+    
+    return agent
 
 
 def create_server_agent(
@@ -82,53 +205,136 @@ def create_server_agent(
     Returns:
         A compiled LangGraph agent ready for deployment
     """
-    # Use provided values or fall back to defaults
-    _assistant_id = assistant_id or ASSISTANT_ID
-    _model = model or MODEL_NAME
-    _auto_approve = auto_approve if auto_approve is not None else AUTO_APPROVE
-    _enable_questions = enable_questions if enable_questions is not None else ENABLE_QUESTIONS
+    config = _resolve_config(assistant_id, model, auto_approve, enable_questions)
     
     # Initialize the model object from the string
-    model_obj = init_chat_model(_model)
+    model_obj = init_chat_model(config.model_name)
     
-    # Build list of additional tools
-    extra_tools = []
-    if _enable_questions:
-        ask_human_tool = create_ask_human_tool()
-        extra_tools.append(ask_human_tool)
-        print(f"✅ ask_human tool enabled")
+    return _build_server_agent(config, model_obj)
+
+
+async def acreate_server_agent(
+    assistant_id: str | None = None,
+    model: str | None = None,
+    auto_approve: bool | None = None,
+    enable_questions: bool | None = None,
+    use_checkpointer: bool = False,
+) -> CompiledStateGraph:
+    """Async version of `create_server_agent` for programmatic use.
     
-    # Create the base agent using create_cli_agent
-    # Note: use_persistence=False because LangGraph API handles persistence automatically
-    agent, backend = create_cli_agent(
-        model=model_obj,
-        assistant_id=_assistant_id,
-        tools=extra_tools,  # Pass ask_human tool
-        auto_approve=_auto_approve,
-        enable_memory=ENABLE_MEMORY,
-        enable_skills=ENABLE_SKILLS,
-        enable_shell=ENABLE_SHELL,
-        use_persistence=False,  # LangGraph API handles persistence
-    )
+    The LangGraph server loads the module-level `graph` built by the sync
+    factory; this one is for async callers that run the agent themselves,
+    typically with `use_checkpointer=True`. Model initialization and agent
+    construction (which touches the filesystem) run in worker threads so the
+    event loop is never blocked. Model initialization overlaps with
+    checkpointer setup when one is requested.
+    
+    Args:
+        assistant_id: Override the default assistant ID
+        model: Override the default model
+        auto_approve: Override auto-approve setting
+        enable_questions: Override questions feature
+        use_checkpointer: Attach the shared checkpointer from `setup_checkpointer()`.
+            Leave False only if the caller persists state some other way.
+        
+    Returns:
+        A compiled LangGraph agent ready for deployment
+    """
+    config = _resolve_config(assistant_id, model, auto_approve, enable_questions)
     
-    print(f"✅ Agent server created")
-    print(f"   Assistant ID: {_assistant_id}")
-    print(f"   Model: {_model}")
-    print(f"   Questions enabled: {_enable_questions}")
+    model_init = asyncio.to_thread(init_chat_model, config.model_name)
+    if use_checkpointer:
+        model_obj, checkpointer = await asyncio.gather(model_init, setup_checkpointer())
+    else:
+        model_obj, checkpointer = await model_init, None
     
-    return agent
+    return await asyncio.to_thread(_build_server_agent, config, model_obj, checkpointer)
 
 
-def create_checkpointer():
-    """Create the appropriate checkpointer based on configuration."""
-    if POSTGRES_URI:
+@functools.lru_cache(maxsize=1)
+def create_checkpointer() -> BaseCheckpointSaver:
+    """Create the appropriate checkpointer based on configuration.
+    
+    The result is cached, so every caller shares one checkpointer (and, for
+    Postgres, one connection pool). The Postgres saver is async-only and its
+    pool is created closed; await `setup_checkpointer()` to get it ready for
+    use and `close_checkpointer()` to release it.
+    """
+    if _CONFIG.postgres_uri:
         print(f"Using PostgreSQL checkpointer")
-        return PostgresSaver.from_conn_string(POSTGRES_URI)
+        pool = AsyncConnectionPool(
+            _CONFIG.postgres_uri,
+            min_size=2,
+            max_size=20,
+            open=False,
+            # Connection settings required by the Postgres checkpointer
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+        return AsyncPostgresSaver(pool)
     else:
         print(f"Using in-memory checkpointer (state will not persist across restarts)")
         return InMemorySaver()
 
 
+# Locks and connection pools are bound to the event loop they were created on,
+# so setup state is tracked per loop rather than as a plain "ready" flag.
+_checkpointer_lock: asyncio.Lock | None = None
+_checkpointer_lock_loop: asyncio.AbstractEventLoop | None = None
+_checkpointer_loop: asyncio.AbstractEventLoop | None = None  # Loop the shared checkpointer is ready on
+
+
+def _get_checkpointer_lock() -> asyncio.Lock:
+    """Return the setup lock for the running event loop."""
+    global _checkpointer_lock, _checkpointer_lock_loop
+    loop = asyncio.get_running_loop()
+    if _checkpointer_lock is None or _checkpointer_lock_loop is not loop:
+        _checkpointer_lock = asyncio.Lock()
+        _checkpointer_lock_loop = loop
+    return _checkpointer_lock
+
+
+async def setup_checkpointer() -> BaseCheckpointSaver:
+    """Return the shared checkpointer, opening its pool and tables on first call.
+    
+    Concurrent callers wait until setup has finished, so the returned saver
+    always has its tables in place. A checkpointer set up on an earlier event
+    loop (e.g. a previous `asyncio.run`) is discarded and rebuilt for the
+    current one.
+    """
+    global _checkpointer_loop
+    loop = asyncio.get_running_loop()
+    if _checkpointer_loop is not loop:
+        async with _get_checkpointer_lock():
+            if _checkpointer_loop is not loop:
+                # The old pool belongs to a finished loop and cannot be reused
+                create_checkpointer.cache_clear()
+                checkpointer = create_checkpointer()
+                if isinstance(checkpointer, AsyncPostgresSaver):
+                    try:
+                        await checkpointer.conn.open()
+                        await checkpointer.setup()
+                    except BaseException:
+                        await checkpointer.conn.close()
+                        create_checkpointer.cache_clear()
+                        raise
+                _checkpointer_loop = loop
+    return create_checkpointer()
+
+
+async def close_checkpointer() -> None:
+    """Close the shared checkpointer's connection pool, if it was set up."""
+    global _checkpointer_loop
+    async with _get_checkpointer_lock():
+        if _checkpointer_loop is None:
+            return
+        checkpointer = create_checkpointer()
+        # A pool from an earlier, finished loop cannot be closed from here; just drop it
+        if isinstance(checkpointer, AsyncPostgresSaver) and _checkpointer_loop is asyncio.get_running_loop():
+            await checkpointer.conn.close()
+        create_checkpointer.cache_clear()
+        _checkpointer_loop = None
+
+
 # ============================================
 # LangGraph Server Entry Point
 # ============================================
@@ -14,7 +14,7 @@ from langchain.messages import AIMessage
 from langchain.tools import BaseTool, tool
 from langgraph.runtime import Runtime
 from langgraph.types import Command, interrupt
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QuestionPriority(str, Enum):
@@ -26,6 +26,10 @@ class QuestionPriority(str, Enum):
     NICE_TO_HAVE = "nice_to_have"  # Optional clarification
 
 
+# Value -> member lookup, cheaper than going through the Enum constructor
+_PRIORITY: dict[str, QuestionPriority] = {p.value: p for p in QuestionPriority}
+
+
 class QuestionOption(BaseModel):
     """Option for multiple choice questions."""
     
@@ -66,6 +70,8 @@ class Question(BaseModel):
 class AskHumanInput(BaseModel):
     """Input schema for the ask_human tool."""
     
+    model_config = ConfigDict(frozen=True)
+    
     question: str = Field(
         description="The question to ask the human. Be specific and clear."
     )
@@ -93,90 +99,118 @@ class AskHumanInput(BaseModel):
     )
 
 
-def create_ask_human_tool() -> BaseTool:
-    """Create the ask_human tool that triggers an interrupt.
+@dataclass(slots=True)
+class _QRecord:
+    """Lightweight record of a question observed in a model response."""
     
-    This tool uses LangGraph's interrupt mechanism to pause execution
-    and wait for a human response.
-    """
+    text: str
+    priority: QuestionPriority
+    confidence: float
+    subject: str | None
+    id: str = field(default_factory=lambda: str(uuid4()))
     
-    @tool("ask_human", args_schema=AskHumanInput)
-    def ask_human(
-        question: str,
-        priority: Literal["blocking", "high", "medium", "nice_to_have"] = "medium",
-        confidence: float = 0.5,
-        options: list[str] | None = None,
-        context_file: str | None = None,
-        subject: str | None = None,
-    ) -> str:
-        """Ask the human a question and wait for their response.
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization.
         
-        Use this tool primarily when you:
-        - Are stuck and need guidance
-        - Are uncertain about the right approach
-
-        Less importantly, use it when you:
-        - Need clarification on requirements
-        - Want to confirm before making significant changes
-        
-        The human will see your question with context and can provide
-        a text answer or choose from options (if provided).
-        
-        Args:
-            question: Your question for the human. Be specific and clear.
-            priority: How urgent is this? 
-                     - "blocking": Cannot proceed without answer
-                     - "high": Important, but can attempt to continue
-                     - "medium": Helpful clarification
-                     - "nice_to_have": Optional, just confirming
-            confidence: Your confidence level (0-1). Lower = more uncertain.
-            options: Optional list of choices for multiple choice.
-            context_file: File path this question relates to.
-            subject: Category for grouping similar questions.
-        
-        Returns:
-            The human's response to your question.
+        Emits the same keys as `Question.model_dump()` so trajectory exports
+        keep their schema.
         """
-        # Build question options if provided
-        question_options = None
-        if options:
-            question_options = [
-                QuestionOption(id=str(i), label=opt)
-                for i, opt in enumerate(options)
-            ]
-        
-        # Build the question object
-        q = Question(
-            text=question,
-            priority=QuestionPriority(priority),
-            confidence=confidence,
-            options=question_options,
-            context={"file": context_file} if context_file else {},
-            subject=subject,
-        )
-        
-        # Interrupt and wait for human response
-        # The UI will display this question and collect the answer
-        response = interrupt({
-            "type": "ask_human",
-            "questions": [q.model_dump()],
-        })
-        
-        # Response format from UI: {"answers": {"question_id": "answer"}, "type": "questions_answered"}
-        if isinstance(response, dict):
-            answers = response.get("answers", {})
-            if q.id in answers:
-                return answers[q.id]
-            # Fallback: return first answer if only one question
-            if answers:
-                return next(iter(answers.values()))
-        
-        # Raw string response
-        if isinstance(response, str):
-            return response
-        
-        return str(response)
+        return {
+            "id": self.id,
+            "text": self.text,
+            "priority": self.priority,
+            "confidence": self.confidence,
+            "options": None,
+            "context": {},
+            "subject": self.subject,
+        }
+
+
+@tool("ask_human", args_schema=AskHumanInput)
+def ask_human(
+    question: str,
+    priority: Literal["blocking", "high", "medium", "nice_to_have"] = "medium",
+    confidence: float = 0.5,
+    options: list[str] | None = None,
+    context_file: str | None = None,
+    subject: str | None = None,
+) -> str:
+    """Ask the human a question and wait for their response.
+
+    Use this tool primarily when you:
+    - Are stuck and need guidance
+    - Are uncertain about the right approach
+
+    Less importantly, use it when you:
+    - Need clarification on requirements
+    - Want to confirm before making significant changes
+
+    The human will see your question with context and can provide
+    a text answer or choose from options (if provided).
+
+    Args:
+        question: Your question for the human. Be specific and clear.
+        priority: How urgent is this? 
+                 - "blocking": Cannot proceed without answer
+                 - "high": Important, but can attempt to continue
+                 - "medium": Helpful clarification
+                 - "nice_to_have": Optional, just confirming
+        confidence: Your confidence level (0-1). Lower = more uncertain.
+        options: Optional list of choices for multiple choice.
+        context_file: File path this question relates to.
+        subject: Category for grouping similar questions.
+
+    Returns:
+        The human's response to your question.
+    """
+    # Build question options if provided
+    question_options = None
+    if options:
+        question_options = [
+            QuestionOption(id=str(i), label=opt)
+            for i, opt in enumerate(options)
+        ]
+
+    # Build the question object
+    q = Question(
+        text=question,
+        priority=_PRIORITY[priority],
+        confidence=confidence,
+        options=question_options,
+        context={"file": context_file} if context_file else {},
+        subject=subject,
+    )
+
+    # Interrupt and wait for human response
+    # The UI will display this question and collect the answer
+    response = interrupt({
+        "type": "ask_human",
+        "questions": [q.model_dump()],
+    })
+
+    # Response format from UI: {"answers": {"question_id": "answer"}, "type": "questions_answered"}
+    if isinstance(response, dict):
+        answers = response.get("answers", {})
+        if q.id in answers:
+            return answers[q.id]
+        # Fallback: return first answer if only one question
+        if answers:
+            return next(iter(answers.values()))
+
+    # Raw string response
+    if isinstance(response, str):
+        return response
+
+    return str(response)
+
+
+def create_ask_human_tool() -> BaseTool:
+    """Return the ask_human tool that triggers an interrupt.
     
+    This tool uses LangGraph's interrupt mechanism to pause execution
+    and wait for a human response. The tool holds no per-call state, so
+    it is built once at import and the same instance is returned.
+    """
     return ask_human
 
 
@@ -190,7 +224,7 @@ class QuestionsMiddleware(AgentMiddleware):
     3. Tracks questions and answers for trajectory collection
     """
     
-    questions_asked: list[Question] = field(default_factory=list)
+    questions_asked: list[_QRecord] = field(default_factory=list)
     answers_received: dict[str, str] = field(default_factory=dict)
     
     def modify_state(
@@ -203,10 +237,8 @@ class QuestionsMiddleware(AgentMiddleware):
         
         # Add to tools if not already present
         existing_tools = state.get("tools", [])
-        tool_names = {t.name for t in existing_tools if hasattr(t, "name")}
-        
-        if "ask_human" not in tool_names:
-            state["tools"] = list(existing_tools) + [ask_human_tool]
+        if not any(getattr(t, "name", None) == "ask_human" for t in existing_tools):
+            state["tools"] = [*existing_tools, ask_human_tool]
         
         return state
     
@@ -217,25 +249,31 @@ class QuestionsMiddleware(AgentMiddleware):
         runtime: Runtime,
     ) -> AIMessage:
         """Track questions asked by the agent."""
-        # Check if any tool calls are ask_human
-        if response.tool_calls:
-            for tc in response.tool_calls:
-                if tc.get("name") == "ask_human":
-                    args = tc.get("args", {})
-                    q = Question(
-                        text=args.get("question", ""),
-                        priority=QuestionPriority(args.get("priority", "medium")),
-                        confidence=args.get("confidence", 0.5),
-                        subject=args.get("subject"),
-                    )
-                    self.questions_asked.append(q)
+        # Most turns carry no tool calls at all
+        tool_calls = response.tool_calls
+        if not tool_calls:
+            return response
+        
+        for tc in tool_calls:
+            if tc.get("name") != "ask_human":
+                continue
+            args = tc.get("args", {})
+            self.questions_asked.append(
+                _QRecord(
+                    text=args.get("question", ""),
+                    priority=_PRIORITY.get(args.get("priority"), QuestionPriority.MEDIUM),
+                    # Raw tool-call args: coerce and clamp like Question's 0-1 float field
+                    confidence=min(max(float(args.get("confidence", 0.5)), 0.0), 1.0),
+                    subject=args.get("subject"),
+                )
+            )
         
         return response
     
     def get_trajectory_data(self) -> dict[str, Any]:
         """Return question/answer data for trajectory collection."""
         return {
-            "questions": [q.model_dump() for q in self.questions_asked],
+            "questions": [q.to_dict() for q in self.questions_asked],
             "answers": self.answers_received,
             "total_questions": len(self.questions_asked),
             "blocking_questions": sum(
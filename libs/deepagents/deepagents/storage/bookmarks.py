@@ -4,15 +4,17 @@ This module provides a BookmarkManager that stores named references to LangGraph
 Bookmarks allow users to save conversation states and resume from them later.
 """
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
 import psycopg
+from psycopg_pool import AsyncConnectionPool
 
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     """A saved reference to a conversation checkpoint."""
 
@@ -38,12 +40,19 @@ class Bookmark:
 class BookmarkManager:
     """Manage conversation bookmarks in PostgreSQL.
 
-    Uses psycopg3 for async PostgreSQL operations. Bookmarks are stored
-    in a dedicated table and reference LangGraph checkpoints.
+    Uses psycopg3 for async PostgreSQL operations. Connections come from a
+    pool that is opened on first use and shared by all operations on the
+    manager. Bookmarks are stored in a dedicated table and reference
+    LangGraph checkpoints.
 
     Usage:
+        async with BookmarkManager(postgres_uri) as manager:  # Closes the pool on exit
+            await manager.initialize()  # Creates table if needed
+            ...
+
+        # Or manage the lifetime manually
         manager = BookmarkManager(postgres_uri)
-        await manager.initialize()  # Creates table if needed
+        await manager.initialize()
 
         # Save a bookmark
         bookmark = await manager.save(thread_id, checkpoint_id, name="my-save")
@@ -54,6 +63,8 @@ class BookmarkManager:
         # Resume from bookmark
         bookmark = await manager.get("my-save")  # by name
         bookmark = await manager.get("abc-123")  # or by ID
+
+        await manager.close()  # Release pooled connections
     """
 
     TABLE_NAME = "conversation_bookmarks"
@@ -65,6 +76,33 @@ class BookmarkManager:
             postgres_uri: PostgreSQL connection URI (same as used for LangGraph).
         """
         self.postgres_uri = postgres_uri
+        self._pool: AsyncConnectionPool | None = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self) -> AsyncConnectionPool:
+        """Return the connection pool, opening it on first use."""
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    pool = AsyncConnectionPool(self.postgres_uri, min_size=1, max_size=10, open=False)
+                    await pool.open()
+                    self._pool = pool
+        return self._pool
+
+    async def close(self) -> None:
+        """Close the connection pool, if it was opened."""
+        async with self._pool_lock:
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+
+    async def __aenter__(self) -> "BookmarkManager":
+        """Return the manager; the pool still opens lazily on first use."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the connection pool on exit."""
+        await self.close()
 
     async def initialize(self) -> None:
         """Create the bookmarks table if it doesn't exist."""
@@ -83,8 +121,18 @@ class BookmarkManager:
         CREATE INDEX IF NOT EXISTS idx_bookmarks_name 
             ON {self.TABLE_NAME} (name) WHERE name IS NOT NULL;
         """
-        async with await psycopg.AsyncConnection.connect(self.postgres_uri) as conn:
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
             async with conn.cursor() as cur:
+                # Skip the DDL entirely on restarts where the table and its indexes are already there
+                await cur.execute(
+                    "SELECT to_regclass(%s), to_regclass(%s), to_regclass(%s)",
+                    (self.TABLE_NAME, "idx_bookmarks_thread_id", "idx_bookmarks_name"),
+                )
+                row = await cur.fetchone()
+                if row is not None and all(oid is not None for oid in row):
+                    return
+                # No parameters, so the whole DDL batch goes in one round-trip
                 await cur.execute(create_table_sql)
             await conn.commit()
 
@@ -110,17 +158,17 @@ class BookmarkManager:
             ValueError: If a bookmark with the given name already exists.
         """
         bookmark_id = str(uuid4())
-        created_at = datetime.now(timezone.utc)
 
+        # created_at comes from the column default so timestamps use the database clock
         insert_sql = f"""
-        INSERT INTO {self.TABLE_NAME} (id, thread_id, checkpoint_id, name, description, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        INSERT INTO {self.TABLE_NAME} (id, thread_id, checkpoint_id, name, description)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING created_at
         """
 
+        pool = await self._get_pool()
         try:
-            async with await psycopg.AsyncConnection.connect(
-                self.postgres_uri
-            ) as conn:
+            async with pool.connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute(
                         insert_sql,
@@ -130,9 +178,9 @@ class BookmarkManager:
                             checkpoint_id,
                             name,
                             description,
-                            created_at,
                         ),
                     )
+                    row = await cur.fetchone()
                 await conn.commit()
         except psycopg.errors.UniqueViolation as e:
             raise ValueError(f"Bookmark with name '{name}' already exists") from e
@@ -143,7 +191,7 @@ class BookmarkManager:
             checkpoint_id=checkpoint_id,
             name=name,
             description=description,
-            created_at=created_at,
+            created_at=row[0],
         )
 
     async def get(self, identifier: str) -> Bookmark | None:
@@ -155,15 +203,27 @@ class BookmarkManager:
         Returns:
             The Bookmark if found, None otherwise.
         """
-        # Try to find by name first, then by ID
+        # Try to find by name first, then by ID. Each branch is a separate
+        # SELECT so it can use its own index instead of an OR scan.
         select_sql = f"""
-        SELECT id, thread_id, checkpoint_id, name, description, created_at
-        FROM {self.TABLE_NAME}
-        WHERE name = %s OR id = %s
+        (
+            SELECT id, thread_id, checkpoint_id, name, description, created_at
+            FROM {self.TABLE_NAME}
+            WHERE name = %s
+            LIMIT 1
+        )
+        UNION ALL
+        (
+            SELECT id, thread_id, checkpoint_id, name, description, created_at
+            FROM {self.TABLE_NAME}
+            WHERE id = %s
+            LIMIT 1
+        )
         LIMIT 1
         """
 
-        async with await psycopg.AsyncConnection.connect(self.postgres_uri) as conn:
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(select_sql, (identifier, identifier))
                 row = await cur.fetchone()
@@ -171,14 +231,8 @@ class BookmarkManager:
         if row is None:
             return None
 
-        return Bookmark(
-            id=row[0],
-            thread_id=row[1],
-            checkpoint_id=row[2],
-            name=row[3],
-            description=row[4],
-            created_at=row[5],
-        )
+        # Column order in the SELECT matches Bookmark's field order
+        return Bookmark(*row)
 
     async def list(self, thread_id: str | None = None) -> list[Bookmark]:
         """List bookmarks, optionally filtered by thread.
@@ -206,22 +260,13 @@ class BookmarkManager:
             params = ()
 
         bookmarks = []
-        async with await psycopg.AsyncConnection.connect(self.postgres_uri) as conn:
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(select_sql, params)
-                rows = await cur.fetchall()
-
-        for row in rows:
-            bookmarks.append(
-                Bookmark(
-                    id=row[0],
-                    thread_id=row[1],
-                    checkpoint_id=row[2],
-                    name=row[3],
-                    description=row[4],
-                    created_at=row[5],
-                )
-            )
+                # Build bookmarks while iterating rather than copying every row into an intermediate list first
+                async for row in cur:
+                    bookmarks.append(Bookmark(*row))
 
         return bookmarks
 
@@ -239,7 +284,8 @@ class BookmarkManager:
         WHERE name = %s OR id = %s
         """
 
-        async with await psycopg.AsyncConnection.connect(self.postgres_uri) as conn:
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(delete_sql, (identifier, identifier))
                 deleted = cur.rowcount > 0
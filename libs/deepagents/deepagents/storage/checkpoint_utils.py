@@ -8,8 +8,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+# Checkpoint sources shown in the picker:
+# "input" = user message, "loop" = agent step, "fork" = forked state
+_INCLUDED_SOURCES = frozenset(("input", "loop", "fork"))
 
-@dataclass
+
+@dataclass(slots=True)
 class CheckpointSummary:
     """Human-readable summary of a checkpoint state."""
 
@@ -34,6 +38,29 @@ class CheckpointSummary:
         }
 
 
+def _extract_text(content: Any, max_length: int) -> str:
+    """Flatten message content to text and truncate it to max_length."""
+    # Handle content that might be a list (tool_use blocks)
+    if isinstance(content, list):
+        # Extract text from content blocks
+        text_parts = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                text_parts.append(block.get("text", ""))
+            elif isinstance(block, str):
+                text_parts.append(block)
+        content = " ".join(text_parts)
+
+    if not isinstance(content, str):
+        content = str(content)
+
+    # Truncate
+    if len(content) > max_length:
+        content = content[: max_length - 3] + "..."
+
+    return content
+
+
 def extract_last_messages(
     messages: list[dict[str, Any]], max_length: int = 100
 ) -> tuple[str | None, str | None]:
@@ -50,31 +77,14 @@ def extract_last_messages(
     last_ai = None
 
     for msg in reversed(messages):
+        # Only pay for text extraction on the messages we actually keep
         msg_type = msg.get("type", "")
-        content = msg.get("content", "")
-
-        # Handle content that might be a list (tool_use blocks)
-        if isinstance(content, list):
-            # Extract text from content blocks
-            text_parts = []
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    text_parts.append(block.get("text", ""))
-                elif isinstance(block, str):
-                    text_parts.append(block)
-            content = " ".join(text_parts)
-
-        if not isinstance(content, str):
-            content = str(content)
-
-        # Truncate
-        if len(content) > max_length:
-            content = content[: max_length - 3] + "..."
-
         if msg_type == "human" and last_human is None:
-            last_human = content
+            last_human = _extract_text(msg.get("content", ""), max_length)
         elif msg_type == "ai" and last_ai is None:
-            last_ai = content
+            last_ai = _extract_text(msg.get("content", ""), max_length)
+        else:
+            continue
 
         # Stop once we have both
         if last_human is not None and last_ai is not None:
@@ -96,6 +106,4 @@ def should_include_checkpoint(checkpoint_metadata: dict[str, Any]) -> bool:
         True if the checkpoint should be shown to users.
     """
     # Include checkpoints from human input or agent response
-    source = checkpoint_metadata.get("source", "")
-    # "input" = user message, "loop" = agent step, "fork" = forked state
-    return source in ("input", "loop", "fork")
+    return checkpoint_metadata.get("source", "") in _INCLUDED_SOURCES
@@ -0,0 +1,96 @@
+"""Unit tests for QuestionsMiddleware and the ask_human tool."""
+
+from langchain.messages import AIMessage
+
+from deepagents.middleware.questions import (
+    Question,
+    QuestionPriority,
+    QuestionsMiddleware,
+    create_ask_human_tool,
+)
+
+
+def _ask_human_call(call_id: str = "call_1", **args: object) -> dict:
+    return {"name": "ask_human", "args": {"question": "Which DB?", **args}, "id": call_id, "type": "tool_call"}
+
+
+class TestQuestionsMiddleware:
+    """Test cases for question tracking in QuestionsMiddleware."""
+
+    def test_trajectory_question_keys_match_question_model(self):
+        """Test that exported questions keep the Question.model_dump() schema."""
+        middleware = QuestionsMiddleware()
+        middleware.process_response({}, AIMessage(content="", tool_calls=[_ask_human_call()]), None)
+
+        questions = middleware.get_trajectory_data()["questions"]
+        assert len(questions) == 1
+        assert questions[0].keys() == Question(text="x").model_dump().keys()
+        assert questions[0]["text"] == "Which DB?"
+        assert questions[0]["options"] is None
+        assert questions[0]["context"] == {}
+
+    def test_blocking_questions_count(self):
+        """Test that only blocking-priority questions are counted as blocking."""
+        middleware = QuestionsMiddleware()
+        response = AIMessage(
+            content="",
+            tool_calls=[
+                _ask_human_call("call_1", priority="blocking"),
+                _ask_human_call("call_2", priority="high"),
+                _ask_human_call("call_3", priority="blocking"),
+            ],
+        )
+        middleware.process_response({}, response, None)
+
+        data = middleware.get_trajectory_data()
+        assert data["total_questions"] == 3
+        assert data["blocking_questions"] == 2
+
+    def test_response_without_tool_calls_is_ignored(self):
+        """Test that a plain AI turn records no questions."""
+        middleware = QuestionsMiddleware()
+        response = AIMessage(content="Done.")
+
+        assert middleware.process_response({}, response, None) is response
+        assert middleware.questions_asked == []
+
+    def test_non_ask_human_tool_calls_are_ignored(self):
+        """Test that tool calls other than ask_human record no questions."""
+        middleware = QuestionsMiddleware()
+        response = AIMessage(
+            content="",
+            tool_calls=[{"name": "read_file", "args": {"file_path": "/a.txt"}, "id": "call_1", "type": "tool_call"}],
+        )
+
+        assert middleware.process_response({}, response, None) is response
+        assert middleware.questions_asked == []
+
+    def test_unknown_priority_falls_back_to_medium(self):
+        """Test that an unrecognized priority is recorded as MEDIUM."""
+        middleware = QuestionsMiddleware()
+        middleware.process_response({}, AIMessage(content="", tool_calls=[_ask_human_call(priority="urgent")]), None)
+
+        assert middleware.questions_asked[0].priority == QuestionPriority.MEDIUM
+
+    def test_confidence_is_coerced_to_float(self):
+        """Test that confidence from raw tool-call args is stored as a 0-1 float."""
+        middleware = QuestionsMiddleware()
+        response = AIMessage(
+            content="",
+            tool_calls=[
+                _ask_human_call("call_1", confidence="0.25"),
+                _ask_human_call("call_2", confidence=3),
+            ],
+        )
+        middleware.process_response({}, response, None)
+
+        assert [q.confidence for q in middleware.questions_asked] == [0.25, 1.0]
+
+
+class TestAskHumanTool:
+    """Test cases for the ask_human tool factory."""
+
+    def test_factory_returns_shared_instance(self):
+        """Test that the tool is built once and reused."""
+        assert create_ask_human_tool() is create_ask_human_tool()
+        assert create_ask_human_tool().name == "ask_human"
@@ -0,0 +1,58 @@
+"""Unit tests for checkpoint picker helpers."""
+
+from deepagents.storage.checkpoint_utils import extract_last_messages, should_include_checkpoint
+
+
+class TestExtractLastMessages:
+    """Test cases for extracting the latest human and AI messages."""
+
+    def test_returns_latest_human_and_ai(self):
+        """Test that the most recent human and AI messages are returned."""
+        messages = [
+            {"type": "human", "content": "first question"},
+            {"type": "ai", "content": "first answer"},
+            {"type": "human", "content": "second question"},
+            {"type": "tool", "content": "tool output"},
+            {"type": "ai", "content": "second answer"},
+        ]
+        assert extract_last_messages(messages) == ("second question", "second answer")
+
+    def test_missing_types_are_none(self):
+        """Test that a missing message type yields None."""
+        assert extract_last_messages([{"type": "human", "content": "hi"}]) == ("hi", None)
+        assert extract_last_messages([]) == (None, None)
+
+    def test_list_content_is_flattened(self):
+        """Test that text blocks and strings in list content are joined."""
+        messages = [
+            {
+                "type": "ai",
+                "content": [
+                    {"type": "text", "text": "hello"},
+                    {"type": "tool_use", "id": "call_1"},
+                    "world",
+                ],
+            },
+        ]
+        assert extract_last_messages(messages) == (None, "hello world")
+
+    def test_truncates_long_content(self):
+        """Test that long content is truncated to max_length with an ellipsis."""
+        messages = [{"type": "human", "content": "x" * 50}]
+        human, _ = extract_last_messages(messages, max_length=10)
+        assert human == "xxxxxxx..."
+        assert len(human) == 10
+
+
+class TestShouldIncludeCheckpoint:
+    """Test cases for filtering checkpoints shown in the picker."""
+
+    def test_user_facing_sources_are_included(self):
+        """Test that input, loop and fork checkpoints are shown."""
+        for source in ("input", "loop", "fork"):
+            assert should_include_checkpoint({"source": source})
+
+    def test_other_sources_are_excluded(self):
+        """Test that other or missing sources are hidden."""
+        assert not should_include_checkpoint({"source": "update"})
+        assert not should_include_checkpoint({})